@@ -13,12 +13,25 @@
 # limitations under the License.
 
 from argparse import ArgumentParser, Namespace
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
+if TYPE_CHECKING:
+    from mnemonic import Mnemonic
 
-def generate_words(language: str = 'english', count: int = 24) -> str:
+
+@lru_cache(maxsize=8)
+def _get_mnemonic(language: str) -> 'Mnemonic':
+    """Return a `Mnemonic` for the language, which is cached because creating it loads the whole wordlist."""
     from mnemonic import Mnemonic
-    mnemonic = Mnemonic(language)
-    return mnemonic.generate(strength=int(count * 10.67))
+    return Mnemonic(language)
+
+
+def generate_words(language: str = 'english', count: int = 24) -> str:
+    from hathor.wallet.hd_wallet import WORD_COUNT_CHOICES, get_words_strength
+    if count not in WORD_COUNT_CHOICES:
+        raise ValueError('Word count ({}) is not one of the options {}.'.format(count, WORD_COUNT_CHOICES))
+    return _get_mnemonic(language).generate(strength=get_words_strength(count))
 
 
 def create_parser() -> ArgumentParser:
@@ -136,9 +136,17 @@ class GenericVertex(ABC, Generic[StaticMetadataT]):
     HASH_NONCE_SIZE = 16
     HEX_BASE = 16
 
+    # Whether this vertex is a block or a transaction. These are plain class attributes set by each subclass instead
+    # of properties, so checking them in hot loops is a single attribute load.
+    is_block: ClassVar[bool]
+    is_transaction: ClassVar[bool]
+
     _metadata: Optional[TransactionMetadata]
     _static_metadata: StaticMetadataT | None
 
+    # The static metadata type of this vertex type, used to load its static metadata from storage.
+    static_metadata_cls: type[StaticMetadataT]
+
     # Bits extracted from the first byte of the version field. They carry extra information that may be interpreted
     # differently by each subclass of BaseTransaction.
     # Currently only the Block subclass uses it, carrying information about Feature Activation bits and also extra
@@ -220,16 +228,6 @@ class GenericVertex(ABC, Generic[StaticMetadataT]):
         class_name = type(self).__name__
         return '%s(%s)' % (class_name, ', '.join('%s=%s' % i for i in self._get_formatted_fields_dict().items()))
 
-    @property
-    @abstractmethod
-    def is_block(self) -> bool:
-        raise NotImplementedError
-
-    @property
-    @abstractmethod
-    def is_transaction(self) -> bool:
-        raise NotImplementedError
-
     def get_fields_from_struct(self, struct_bytes: bytes, *, verbose: VerboseCallback = None) -> bytes:
         """ Gets all common fields for a Transaction and a Block from a buffer.
 
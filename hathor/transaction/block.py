@@ -43,6 +43,9 @@ _SIGHASH_ALL_FORMAT_STRING = '!BBBB'
 
 class Block(GenericVertex[BlockStaticMetadata]):
     SERIALIZATION_NONCE_SIZE = 16
+    is_block = True
+    is_transaction = False
+    static_metadata_cls = BlockStaticMetadata
 
     def __init__(
         self,
@@ -78,16 +81,6 @@ class Block(GenericVertex[BlockStaticMetadata]):
             d.update(data=self.data.hex())
         return d
 
-    @property
-    def is_block(self) -> bool:
-        """Returns true if this is a block"""
-        return True
-
-    @property
-    def is_transaction(self) -> bool:
-        """Returns true if this is a transaction"""
-        return False
-
     @classmethod
     def create_from_struct(cls, struct_bytes: bytes, storage: Optional['TransactionStorage'] = None,
                            *, verbose: VerboseCallback = None) -> Self:
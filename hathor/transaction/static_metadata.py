@@ -14,17 +14,18 @@
 
 from __future__ import annotations
 
-from abc import ABC
-from itertools import chain, starmap, zip_longest
+from abc import ABC, abstractmethod
+from itertools import starmap, zip_longest
 from operator import add
-from typing import TYPE_CHECKING, Callable
+from typing import TYPE_CHECKING, Any, Callable, cast
 
-from typing_extensions import Self
+from pydantic import PrivateAttr
+from typing_extensions import Self, override
 
 from hathor.feature_activation.feature import Feature
 from hathor.feature_activation.model.feature_state import FeatureState
 from hathor.types import VertexId
-from hathor.util import json_loadb
+from hathor.util import json_dumpb, json_loadb
 from hathor.utils.pydantic import BaseModel
 
 if TYPE_CHECKING:
@@ -47,19 +48,34 @@ class VertexStaticMetadata(ABC, BaseModel):
     # metadata (that does not have this calculated, from a tx with a new format that does have this calculated)
     min_height: int
 
+    # Cached json bytes representation, as this model is immutable it's safe to compute it only once.
+    _json_bytes: bytes | None = PrivateAttr(default=None)
+
+    def json_dumpb(self) -> bytes:
+        """Return the json bytes representation of this static metadata, computing it only on the first call."""
+        if self._json_bytes is None:
+            self._json_bytes = json_dumpb(self._to_json_dict())
+        return self._json_bytes
+
+    @abstractmethod
+    def _to_json_dict(self) -> dict[str, Any]:
+        """Return a json-serializable dict of this static metadata, without the deep copy done by `dict()`."""
+        raise NotImplementedError
+
+    @classmethod
+    def _from_json_dict(cls, json_dict: dict[str, Any]) -> Self:
+        """Create a static metadata instance from a dict created by `_to_json_dict`.
+        Validation is skipped, as the data was serialized from an already validated instance."""
+        return cls.construct(**json_dict)
+
     @classmethod
     def from_bytes(cls, data: bytes, *, target: 'BaseTransaction') -> 'VertexStaticMetadata':
         """Create a static metadata instance from a json bytes representation, with a known vertex type target."""
-        from hathor.transaction import Block, Transaction
-        json_dict = json_loadb(data)
+        static_metadata = target.static_metadata_cls._from_json_dict(json_loadb(data))
 
-        if isinstance(target, Block):
-            return BlockStaticMetadata(**json_dict)
-
-        if isinstance(target, Transaction):
-            return TransactionStaticMetadata(**json_dict)
-
-        raise NotImplementedError
+        # the bytes we've just loaded are already a json representation of this static metadata
+        static_metadata._json_bytes = data
+        return static_metadata
 
 
 class BlockStaticMetadata(VertexStaticMetadata):
@@ -73,6 +89,27 @@ class BlockStaticMetadata(VertexStaticMetadata):
     # A dict of features in the feature activation process and their respective state.
     feature_states: dict[Feature, FeatureState]
 
+    @override
+    def _to_json_dict(self) -> dict[str, Any]:
+        return dict(
+            min_height=self.min_height,
+            height=self.height,
+            feature_activation_bit_counts=self.feature_activation_bit_counts,
+            feature_states={feature.value: state.value for feature, state in self.feature_states.items()},
+        )
+
+    @classmethod
+    @override
+    def _from_json_dict(cls, json_dict: dict[str, Any]) -> Self:
+        return cls.construct(
+            min_height=json_dict['min_height'],
+            height=json_dict['height'],
+            feature_activation_bit_counts=json_dict['feature_activation_bit_counts'],
+            feature_states={
+                Feature(feature): FeatureState(state) for feature, state in json_dict['feature_states'].items()
+            },
+        )
+
     @classmethod
     def create_from_storage(cls, block: 'Block', settings: HathorSettings, storage: 'TransactionStorage') -> Self:
         """Create a `BlockStaticMetadata` using dependencies provided by a storage."""
@@ -86,7 +123,7 @@ class BlockStaticMetadata(VertexStaticMetadata):
         vertex_getter: Callable[[VertexId], 'BaseTransaction']
     ) -> Self:
         """Create a `BlockStaticMetadata` using dependencies provided by a `vertex_getter`.
-        This must be fast, ideally O(1)."""
+        This must be fast, ideally O(1), so validation is skipped as all values are calculated here."""
         height = cls._calculate_height(block, vertex_getter)
         min_height = cls._calculate_min_height(block, vertex_getter)
         feature_activation_bit_counts = cls._calculate_feature_activation_bit_counts(
@@ -96,7 +133,7 @@ class BlockStaticMetadata(VertexStaticMetadata):
             vertex_getter,
         )
 
-        return cls(
+        return cls.construct(
             height=height,
             min_height=min_height,
             feature_activation_bit_counts=feature_activation_bit_counts,
@@ -105,27 +142,34 @@ class BlockStaticMetadata(VertexStaticMetadata):
 
     @staticmethod
     def _calculate_height(block: 'Block', vertex_getter: Callable[[VertexId], 'BaseTransaction']) -> int:
-        """Return the height of the block, i.e., the number of blocks since genesis"""
+        """Return the height of the block, i.e., the number of blocks since genesis.
+
+        Walks up the parent chain iteratively, stopping at the first ancestor that already has its static metadata,
+        so only ancestors without it are fetched one by one."""
         if block.is_genesis:
             return 0
 
-        from hathor.transaction import Block
-        parent_hash = block.get_block_parent_hash()
-        parent_block = vertex_getter(parent_hash)
-        assert isinstance(parent_block, Block)
-        return parent_block.static_metadata.height + 1
+        height = 1
+        parent_block = cast('Block', vertex_getter(block.get_block_parent_hash()))
+        while parent_block._static_metadata is None and not parent_block.is_genesis:
+            assert parent_block.is_block
+            parent_block = cast('Block', vertex_getter(parent_block.get_block_parent_hash()))
+            height += 1
+
+        assert parent_block.is_block
+        if parent_block.is_genesis:
+            return height
+        return parent_block.static_metadata.height + height
 
     @staticmethod
     def _calculate_min_height(block: 'Block', vertex_getter: Callable[[VertexId], 'BaseTransaction']) -> int:
         """The minimum height the next block needs to have, basically the maximum min-height of this block's parents.
         """
         # maximum min-height of any parent tx
-        min_height = 0
-        for tx_hash in block.get_tx_parents():
-            tx = vertex_getter(tx_hash)
-            min_height = max(min_height, tx.static_metadata.min_height)
-
-        return min_height
+        return max(
+            (vertex_getter(tx_hash).static_metadata.min_height for tx_hash in block.get_tx_parents()),
+            default=0,
+        )
 
     @classmethod
     def _calculate_feature_activation_bit_counts(
@@ -145,6 +189,20 @@ class BlockStaticMetadata(VertexStaticMetadata):
         previous_counts = cls._get_previous_feature_activation_bit_counts(block, height, settings, vertex_getter)
         bit_list = block._get_feature_activation_bit_list()
 
+        if not previous_counts:
+            # Boundary blocks restart the rolling count, so the (freshly built) bit list is already the result.
+            return bit_list
+
+        if not any(bit_list) and len(previous_counts) >= len(bit_list):
+            # Common case: the block doesn't signal any bit, so the counts are the same as the previous ones, which can
+            # be shared as static metadata is immutable.
+            return previous_counts
+
+        if len(previous_counts) == len(bit_list):
+            # Common case: both vectors have the fixed `max_signal_bits` width, so they can be added element-wise
+            # directly, without building the intermediate pairs.
+            return list(map(add, previous_counts, bit_list))
+
         count_and_bit_pairs = zip_longest(previous_counts, bit_list, fillvalue=0)
         updated_counts = starmap(add, count_and_bit_pairs)
         return list(updated_counts)
@@ -166,15 +224,18 @@ class BlockStaticMetadata(VertexStaticMetadata):
         if is_boundary_block:
             return []
 
-        from hathor.transaction import Block
         parent_hash = block.get_block_parent_hash()
-        parent_block = vertex_getter(parent_hash)
-        assert isinstance(parent_block, Block)
+        parent_block = cast('Block', vertex_getter(parent_hash))
+        assert parent_block.is_block
 
         return parent_block.static_metadata.feature_activation_bit_counts
 
 
 class TransactionStaticMetadata(VertexStaticMetadata):
+    @override
+    def _to_json_dict(self) -> dict[str, Any]:
+        return dict(min_height=self.min_height)
+
     @classmethod
     def create_from_storage(cls, tx: 'Transaction', settings: HathorSettings, storage: 'TransactionStorage') -> Self:
         """Create a `TransactionStaticMetadata` using dependencies provided by a storage."""
@@ -188,60 +249,38 @@ class TransactionStaticMetadata(VertexStaticMetadata):
         vertex_getter: Callable[[VertexId], 'BaseTransaction'],
     ) -> Self:
         """Create a `TransactionStaticMetadata` using dependencies provided by a `vertex_getter`.
-        This must be fast, ideally O(1)."""
+        This must be fast, ideally O(1), so validation is skipped as all values are calculated here."""
         min_height = cls._calculate_min_height(
             tx,
             settings,
             vertex_getter=vertex_getter,
         )
 
-        return cls(
+        return cls.construct(
             min_height=min_height
         )
 
-    @classmethod
+    @staticmethod
     def _calculate_min_height(
-        cls,
         tx: 'Transaction',
         settings: HathorSettings,
         vertex_getter: Callable[[VertexId], 'BaseTransaction'],
     ) -> int:
-        """Calculates the min height the first block confirming this tx needs to have for reward lock verification."""
+        """Calculates the min height the first block confirming this tx needs to have for reward lock verification.
+
+        Parents and inputs are walked in a single pass, fetching each distinct vertex only once."""
         if tx.is_genesis:
             return 0
 
-        return max(
-            # 1) don't drop the min height of any parent tx or input tx
-            cls._calculate_inherited_min_height(tx, vertex_getter),
-            # 2) include the min height for any reward being spent
-            cls._calculate_my_min_height(tx, settings, vertex_getter),
-        )
+        input_ids = {tx_input.tx_id for tx_input in tx.inputs}
 
-    @staticmethod
-    def _calculate_inherited_min_height(
-        tx: 'Transaction',
-        vertex_getter: Callable[[VertexId], 'BaseTransaction']
-    ) -> int:
-        """ Calculates min height inherited from any input or parent"""
         min_height = 0
-        iter_parents = tx.get_tx_parents()
-        iter_inputs = (tx_input.tx_id for tx_input in tx.inputs)
-        for vertex_id in chain(iter_parents, iter_inputs):
+        for vertex_id in tx.get_tx_dependencies():
             vertex = vertex_getter(vertex_id)
+            # 1) don't drop the min height of any parent tx or input tx
             min_height = max(min_height, vertex.static_metadata.min_height)
-        return min_height
-
-    @staticmethod
-    def _calculate_my_min_height(
-        tx: 'Transaction',
-        settings: HathorSettings,
-        vertex_getter: Callable[[VertexId], 'BaseTransaction'],
-    ) -> int:
-        """ Calculates min height derived from own spent block rewards"""
-        from hathor.transaction import Block
-        min_height = 0
-        for tx_input in tx.inputs:
-            spent_tx = vertex_getter(tx_input.tx_id)
-            if isinstance(spent_tx, Block):
-                min_height = max(min_height, spent_tx.static_metadata.height + settings.REWARD_SPEND_MIN_BLOCKS + 1)
+            # 2) include the min height for any reward being spent
+            if vertex.is_block and vertex_id in input_ids:
+                spent_block = cast('Block', vertex)
+                min_height = max(min_height, spent_block.static_metadata.height + settings.REWARD_SPEND_MIN_BLOCKS + 1)
         return min_height
@@ -54,6 +54,9 @@ class RewardLockedInfo(NamedTuple):
 class Transaction(GenericVertex[TransactionStaticMetadata]):
 
     SERIALIZATION_NONCE_SIZE = 4
+    is_block = False
+    is_transaction = True
+    static_metadata_cls = TransactionStaticMetadata
 
     def __init__(
         self,
@@ -91,16 +94,6 @@ class Transaction(GenericVertex[TransactionStaticMetadata]):
         self._sighash_cache: Optional[bytes] = None
         self._sighash_data_cache: Optional[bytes] = None
 
-    @property
-    def is_block(self) -> bool:
-        """Returns true if this is a block"""
-        return False
-
-    @property
-    def is_transaction(self) -> bool:
-        """Returns true if this is a transaction"""
-        return True
-
     @classmethod
     def create_from_struct(cls, struct_bytes: bytes, storage: Optional['TransactionStorage'] = None,
                            *, verbose: VerboseCallback = None) -> 'Transaction':
@@ -199,8 +199,6 @@ class MaxSizeOrderedDict(OrderedDict):
 
 def json_loadb(raw: bytes) -> dict:
     """Compact loading as UTF-8 encoded bytes/string to a Python object."""
-    import json
-
     # XXX: from Python3.6 onwards, json.loads can take bytes
     #      See: https://docs.python.org/3/library/json.html#json.loads
     try:
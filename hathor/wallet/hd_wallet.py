@@ -31,6 +31,14 @@ if TYPE_CHECKING:
 WORD_COUNT_CHOICES = [12, 15, 18, 21, 24]
 
 
+def get_words_strength(word_count: int) -> int:
+    """Return the BIP39 entropy strength, in bits, of a mnemonic with `word_count` words.
+
+    Each word encodes 11 bits, of which 1/33 are checksum, so the entropy is 32 bits for every 3 words.
+    """
+    return word_count * 32 // 3
+
+
 _registered_pycoin = False
 
 
@@ -289,8 +297,7 @@ class HDWallet(BaseWallet):
             # Can be a different language than self.mnemonic
             m = Mnemonic(self.language)
             # We can't pass the word_count to generate method, only the strength
-            # Multiplying by 10.67 gives the result we expect
-            words = m.generate(strength=int(self.word_count * 10.67))
+            words = m.generate(strength=get_words_strength(self.word_count))
         self.words = words
         self.passphrase = passphrase
         self._manually_initialize()
@@ -3,7 +3,7 @@ from io import StringIO
 
 from structlog.testing import capture_logs
 
-from hathor.cli.generate_valid_words import create_parser, execute
+from hathor.cli.generate_valid_words import create_parser, execute, generate_words
 from tests import unittest
 
 
@@ -46,3 +46,10 @@ class GenerateWordsTest(unittest.TestCase):
 
         # In japanese is more than 18 when I split by space
         self.assertNotEqual(len(output[0].split(' ')), 18)
+
+    def test_generate_words_all_counts(self):
+        for count in (12, 15, 18, 21, 24):
+            self.assertEqual(len(generate_words(count=count).split(' ')), count)
+
+        with self.assertRaises(ValueError):
+            generate_words(count=27)
@@ -20,13 +20,14 @@ from hathor.conf.get_settings import get_global_settings
 from hathor.conf.settings import HathorSettings
 from hathor.feature_activation.feature import Feature
 from hathor.feature_activation.feature_service import BlockIsMissingSignal, BlockIsSignaling, FeatureService
+from hathor.feature_activation.model.feature_state import FeatureState
 from hathor.indexes import MemoryIndexesManager
 from hathor.transaction import Block
 from hathor.transaction.exceptions import BlockMustSignalError
 from hathor.transaction.static_metadata import BlockStaticMetadata
 from hathor.transaction.storage import TransactionMemoryStorage, TransactionStorage
 from hathor.transaction.validation_state import ValidationState
-from hathor.util import not_none
+from hathor.util import json_dumpb, not_none
 from hathor.verification.block_verifier import BlockVerifier
 
 
@@ -110,6 +111,63 @@ def test_get_height() -> None:
     assert block.get_height() == 10
 
 
+def test_calculate_height_walks_ancestors_without_static_metadata() -> None:
+    settings = get_global_settings()
+    storage = TransactionMemoryStorage(settings=settings)
+    genesis_block = storage.get_block(settings.GENESIS_BLOCK_HASH)
+    block1 = Block(parents=[genesis_block.hash], storage=storage)
+    block1.update_hash()
+    block2 = Block(parents=[block1.hash], storage=storage)
+    block2.update_hash()
+    vertices = {vertex.hash: vertex for vertex in (genesis_block, block1, block2)}
+
+    assert BlockStaticMetadata._calculate_height(block2, vertices.__getitem__) == 2
+
+    block1.init_static_metadata_from_storage(settings, storage)
+    assert BlockStaticMetadata._calculate_height(block2, vertices.__getitem__) == 2
+
+
+def test_static_metadata_json_dumpb_is_cached() -> None:
+    static_metadata = BlockStaticMetadata(
+        min_height=0,
+        height=10,
+        feature_activation_bit_counts=[0, 1, 0, 1],
+        feature_states={},
+    )
+    data = static_metadata.json_dumpb()
+
+    assert static_metadata.json_dumpb() is data
+    assert BlockStaticMetadata.from_bytes(data, target=Block()) == static_metadata
+
+
+def test_static_metadata_json_dumpb_matches_dict() -> None:
+    static_metadata = BlockStaticMetadata(
+        min_height=3,
+        height=10,
+        feature_activation_bit_counts=[0, 1, 0, 1],
+        feature_states={Feature.NOP_FEATURE_1: FeatureState.ACTIVE},
+    )
+
+    assert static_metadata.json_dumpb() == json_dumpb(static_metadata.dict())
+
+
+def test_static_metadata_from_bytes_feature_states() -> None:
+    static_metadata = BlockStaticMetadata(
+        min_height=3,
+        height=10,
+        feature_activation_bit_counts=[0, 1, 0, 1],
+        feature_states={Feature.NOP_FEATURE_1: FeatureState.ACTIVE, Feature.NOP_FEATURE_2: FeatureState.FAILED},
+    )
+    data = static_metadata.json_dumpb()
+    loaded = BlockStaticMetadata.from_bytes(data, target=Block())
+
+    assert loaded == static_metadata
+    assert isinstance(loaded, BlockStaticMetadata)
+    assert all(isinstance(feature, Feature) for feature in loaded.feature_states)
+    assert all(isinstance(state, FeatureState) for state in loaded.feature_states.values())
+    assert loaded.json_dumpb() == data
+
+
 @pytest.mark.parametrize(
     ['signal_bits', 'expected_bit_list'],
     [